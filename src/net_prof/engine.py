@@ -12,13 +12,42 @@ import os
 import json
 import re
 import csv
-from typing import Dict, List, Tuple, Any
+import functools
+import itertools
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Any, Optional
+import numpy as np
+try:
+    import orjson  # optional C-accelerated JSON encoder/decoder
+except ImportError:
+    orjson = None
 from .visualize import (
     iface1_barchart, iface2_barchart, iface3_barchart, iface4_barchart,
     iface5_barchart, iface6_barchart, iface7_barchart, iface8_barchart
 )
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
+# collect() reads interfaces on worker threads; keeps their progress lines whole
+_print_lock = threading.Lock()
+
+
+# Metric IDs (1-based lines of metrics.txt) reported in summary['important_metrics']
+_IMPORTANT_METRIC_IDS = frozenset({17,18,22,839,835,869,873,
+                                   564,565,613,614,
+                                   1600,1599,1598,1597,
+                                   1724})
+
+
+def _parse_cxi(name: str) -> Optional[int]:
+    """Return N for a 'cxi<N>' interface directory name (zero-based device number), else None."""
+    # isdecimal() only admits characters int() can parse
+    if name.startswith('cxi') and name[3:].isdecimal():
+        return int(name[3:])
+    return None
+
 
 def load_lines(path: str) -> List[str]:
     """Read a file and return a list of its lines (no trailing newline)."""
@@ -35,85 +64,260 @@ def parse_counter(raw: str) -> int:
     return int(raw.split('@')[0])
 
 
-def load_grouping_rules(rules_path: str) -> List[Dict]:
-    """Load grouping rules from a CSV into compiled regex patterns."""
-    rules: List[Dict] = []
+# (combined alternation regex, meta) where meta[i] is the (group, description) of rule i
+GroupingRules = Tuple[re.Pattern, List[Tuple[str, str]]]
+
+
+_UNGROUPED = ("UNGROUPED", "No description")
+
+# Rule constructs that change meaning once the rule is spliced into the combined
+# alternation: numbered backreferences/conditionals (group numbers shift) and
+# inline global flags like (?i) (they would apply to every rule, or fail to compile).
+_NUMBERED_REF = re.compile(r'(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?\([1-9])')
+_GLOBAL_FLAGS = re.compile(r'(?<!\\)(?:\\\\)*\(\?[aiLmsux]+\)')
+
+
+@dataclass
+class _CounterRec:
+    """
+    One collected counter, as written to JSON by collect(); slotted so it is much
+    smaller than a dict. Only serialized, never handed to callers.
+    """
+    __slots__ = ('id', 'interface', 'counter_name', 'value', 'timestamp',
+                 'timestamp_ISO_8601', 'group', 'description')
+    id: int
+    interface: int
+    counter_name: str
+    value: int
+    timestamp: Optional[float]
+    timestamp_ISO_8601: Optional[str]
+    group: str
+    description: str
+
+
+def index_counters(entries: List[Dict[str, Any]]) -> Dict[int, Dict[str, int]]:
+    """Index collected entries as {interface: {counter_name: value}}, keeping the first occurrence."""
+    index: Dict[int, Dict[str, int]] = {}
+    for e in entries:
+        index.setdefault(e['interface'], {}).setdefault(e['counter_name'], e['value'])
+    return index
+
+
+def lookup_counter(index: Dict[int, Dict[str, int]], iface: int, metric_name: str) -> int:
+    """Return the value of metric_name on iface from an index_counters() index, or 0 if absent."""
+    counters = index.get(iface)
+    if not counters:
+        return 0
+    value = counters.get(metric_name)
+    if value is not None:
+        return value
+    # fall back to the old suffix match, in collection order
+    return next((v for name, v in counters.items() if name.endswith(metric_name)), 0)
+
+
+def counter_array(values) -> np.ndarray:
+    """
+    Return counter values as an int64 array, or as an object array of Python ints
+    when any value doesn't fit (Cassini counters are u64, so at or above 2**63).
+    """
+    try:
+        return np.asarray(values, dtype=np.int64)
+    except OverflowError:
+        return np.asarray(values, dtype=object)
+
+
+def counter_diff(after: np.ndarray, before: np.ndarray) -> np.ndarray:
+    """
+    Return after - before without wrap-around. Two non-negative int64 arrays are
+    subtracted in int64, where the result always fits; anything else is done in
+    Python ints.
+    """
+    if (after.dtype == np.int64 and before.dtype == np.int64
+            and not (after < 0).any() and not (before < 0).any()):
+        return after - before
+    return after.astype(object) - before.astype(object)
+
+
+def load_counter_values(path: str, count: int) -> np.ndarray:
+    """Parse the first count 'value@timestamp' lines of a txt dump into a counter_array() of values."""
+    with open(path, 'rb') as f:
+        lines = f.read().splitlines()[:count]
+    if len(lines) < count:
+        raise ValueError(f"{path!r} has {len(lines)} counter lines, expected {count}.")
+    return counter_array([int(line.split(b'@', 1)[0]) for line in lines])
+
+
+def top_k_indices(values: np.ndarray, k: int) -> List[int]:
+    """
+    Return the indices of the k largest values, largest first with ties in index order
+    (same as a stable descending sort cut to k), without sorting the whole array.
+    """
+    n = len(values)
+    if k <= 0:
+        return []
+    if k >= n:
+        return np.argsort(-values, kind='stable').tolist()
+    # everything >= the k-th largest value is a candidate; only those get sorted
+    kth = np.partition(values, n - k)[n - k]
+    candidates = np.flatnonzero(values >= kth)
+    order = np.argsort(-values[candidates], kind='stable')[:k]
+    return candidates[order].tolist()
+
+
+def _record_fields(obj: Any) -> Dict[str, Any]:
+    """json.dump default= hook: serialize a _CounterRec as an object of its fields."""
+    if isinstance(obj, _CounterRec):
+        return {name: getattr(obj, name) for name in _CounterRec.__slots__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(entries: List[Any], path: str):
+    """
+    Write collected entries (_CounterRec or dicts) as JSON: indented via orjson when
+    installed, compact stdlib json otherwise.
+    """
+    if orjson is not None:
+        # orjson serializes dataclasses natively, in field order
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(entries, f, separators=(',', ':'), default=_record_fields)
+
+
+def load_json(path: str) -> Any:
+    """Read a JSON file written by dump_json() (either layout) or any other JSON dump."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def load_grouping_rules(rules_path: str) -> GroupingRules:
+    """
+    Load grouping rules from a CSV and combine them into a single alternation regex.
+    Each rule becomes the named alternative r<i>, tried in CSV order, so the first
+    matching rule still wins.
+    Results are cached per (path, mtime), so repeated collect() calls reuse the
+    compiled rules until the CSV changes. Treat the returned rules as read-only.
+    Raises ValueError if a rule defines its own named groups.
+    """
+    return _load_grouping_rules_cached(rules_path, os.stat(rules_path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_grouping_rules_cached(rules_path: str, mtime_ns: int) -> GroupingRules:
+    """Parse and compile rules_path; mtime_ns is only part of the cache key."""
+    patterns: List[str] = []
+    meta: List[Tuple[str, str]] = []
     with open(rules_path, 'r', newline='') as csvfile:
         reader = csv.DictReader(csvfile)  # comma-delimited
         for row in reader:
             pattern = row.get('Regex')
             if not pattern:
                 continue
-            rules.append({
-                'regex': re.compile(pattern, re.IGNORECASE),
-                'group': row.get('Counter_Group', 'UNGROUPED'),
-                'description': row.get('Counter_Description', 'No description')
-            })
-    return rules
-
-
-def match_group_and_description(counter_name: str, rules: list[dict]) -> tuple[str, str]:
-    """Not implemented yet. Return (group, description) for the given counter name based on regex rules."""
-    for rule in rules:
-        if rule['regex'].match(counter_name):
-            return rule['group'], rule['description']
-    return "UNGROUPED", "No description"
-
-
-def _collect_one_interface(telemetry_dir: str, interface_id: int) -> List[Dict[str, Any]]:
+            if re.compile(pattern).groupindex:
+                raise ValueError(f"Grouping rule {pattern!r} must not contain named groups.")
+            if _NUMBERED_REF.search(pattern):
+                raise ValueError(f"Grouping rule {pattern!r} must not contain numbered backreferences.")
+            if _GLOBAL_FLAGS.search(pattern):
+                raise ValueError(f"Grouping rule {pattern!r} must not set inline global flags; "
+                                 f"use a scoped group such as (?i:...) instead.")
+            patterns.append(f"(?P<r{len(patterns)}>{pattern})")
+            meta.append((
+                row.get('Counter_Group', 'UNGROUPED'),
+                row.get('Counter_Description', 'No description')
+            ))
+    # (?!) never matches, so an empty rules file leaves everything UNGROUPED
+    combined = re.compile('|'.join(patterns) if patterns else r"(?!)", re.IGNORECASE)
+    return combined, meta
+
+
+def match_group_and_description(counter_name: str, rules: GroupingRules) -> Tuple[str, str]:
+    """Return (group, description) for the given counter name based on regex rules."""
+    combined, meta = rules
+    m = combined.match(counter_name)
+    if m:
+        return meta[int(m.lastgroup[1:])]
+    return _UNGROUPED
+
+
+def classify_counters(counter_names: List[str], rules: GroupingRules) -> List[Tuple[str, str]]:
+    """Return the (group, description) of every counter name, in order, from one pass of the combined regex."""
+    combined, meta = rules
+    match = combined.match
+    out: List[Tuple[str, str]] = []
+    for name in counter_names:
+        m = match(name)
+        out.append(meta[int(m.lastgroup[1:])] if m else _UNGROUPED)
+    return out
+
+
+def _iso_utc(timestamp: Optional[float], cache: Dict[float, str]) -> Optional[str]:
+    """ISO-8601 UTC string for timestamp, memoized in cache since counters sampled together share one."""
+    if timestamp is None:
+        return None
+    iso = cache.get(timestamp)
+    if iso is None:
+        iso = datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+        cache[timestamp] = iso
+    return iso
+
+
+def _collect_one_interface(telemetry_dir: str, interface_id: int,
+                           rules: GroupingRules, include_iso: bool) -> List[_CounterRec]:
     """
     Read a single /…/cxiX/device/telemetry directory and return a list
-    of counter dicts for that one interface.
+    of counter records for that one interface, grouped using the pre-loaded rules.
     """
-    rules_path = os.path.join(os.path.dirname(__file__), 'data', 'grouping_rules.csv')
-    rules = load_grouping_rules(rules_path)
-
-    collected: List[Dict[str, Any]] = []
-    files = sorted(f for f in os.listdir(telemetry_dir)
-                   if os.path.isfile(os.path.join(telemetry_dir, f)))
-    print(f"  [iface {interface_id}] Found {len(files)} files")
-
+    # DirEntry.is_file() is answered from the directory read, no stat() per file
+    with os.scandir(telemetry_dir) as it:
+        files = sorted(e.name for e in it if e.is_file())
+    with _print_lock:
+        print(f"  [iface {interface_id}] Found {len(files)} files")
+
+    # Phase 1: read every counter file into (id, filename, value, timestamp)
+    raw: List[Tuple[int, str, int, Optional[float]]] = []
     for idx, filename in enumerate(files, start=1):
-        filepath = os.path.join(telemetry_dir, filename)
-        raw = open(filepath, 'r').read().strip()
-        if '@' not in raw:
+        # Raw fd read, skipping the io wrapper: a sysfs attribute fits in one page.
+        # int()/float() accept bytes and ignore surrounding whitespace, so no decode/strip.
+        fd = os.open(os.path.join(telemetry_dir, filename), os.O_RDONLY)
+        try:
+            data = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+        at = data.find(b'@')
+        if at < 0:
             continue
-        value_str, timestamp_str = raw.split('@', 1)
         try:
-            value = int(value_str)
+            value = int(data[:at])
         except ValueError:
             continue
         try:
-            timestamp = float(timestamp_str)
+            timestamp = float(data[at + 1:])
         except ValueError:
             timestamp = None
-            
-        # convert to a human-readable ISO timestamp in UTC
-        human_ts = (
-        datetime.fromtimestamp(timestamp, timezone.utc)
-        .isoformat()
-        if timestamp is not None else None
-        )
+        raw.append((idx, filename, value, timestamp))
 
-        group, description = match_group_and_description(filename, rules)
-        collected.append({
-            'id':            idx,
-            'interface':     interface_id,
-            'counter_name':  filename,
-            'value':         value,
-            'timestamp':     timestamp,
-            'timestamp_ISO_8601': human_ts,
-            'group':         group,
-            'description':   description
-        })
+    # Phase 2: classify all filenames in one tight pass
+    groups = classify_counters([r[1] for r in raw], rules)
+
+    collected: List[_CounterRec] = []
+    iso_cache: Dict[float, str] = {}
+    for (idx, filename, value, timestamp), (group, description) in zip(raw, groups):
+        # convert to a human-readable ISO timestamp in UTC
+        human_ts = _iso_utc(timestamp, iso_cache) if include_iso else None
+        collected.append(_CounterRec(
+            idx, interface_id, filename, value, timestamp, human_ts, group, description
+        ))
 
     return collected
 
 
-def collect(input_path: str, output_file: str):
+def collect(input_path: str, output_file: str, include_iso: bool = False):
     """
     Collect counters from either a single telemetry dir or the entire /sys/class/cxi/ tree.
-    Writes a merged JSON list into output_file.
+    Writes a merged JSON list into output_file. timestamp_ISO_8601 is only filled in
+    when include_iso is True (null otherwise); summarize() and dump_html() never read it.
     Raises ValueError on invalid input.
     """
     # 1) Normalize and verify the base path exists
@@ -121,45 +325,55 @@ def collect(input_path: str, output_file: str):
     if not os.path.isdir(input_path):
         raise ValueError(f"Path {input_path!r} does not exist or is not a directory.")
 
-    all_entries: List[Dict[str, Any]] = []
+    # Load and compile the grouping rules once, shared by every interface
+    rules_path = os.path.join(os.path.dirname(__file__), 'data', 'grouping_rules.csv')
+    rules = load_grouping_rules(rules_path)
 
     basename      = os.path.basename(input_path)
     parent        = os.path.basename(os.path.dirname(input_path))
     grandparent   = os.path.basename(os.path.dirname(os.path.dirname(input_path)))
+    grandparent_cxi = _parse_cxi(grandparent)
 
     # 2A) Single-interface mode: basename is “telemetry” and grandparent is “cxi<digit>”
-    if basename == "telemetry" and re.match(r"cxi\d+", grandparent):
+    if basename == "telemetry" and grandparent_cxi is not None:
         # sanity check: directory not empty
-        files = [f for f in os.listdir(input_path)
-                 if os.path.isfile(os.path.join(input_path, f))]
-        if not files:
+        with os.scandir(input_path) as it:
+            has_files = any(e.is_file() for e in it)
+        if not has_files:
             raise ValueError(f"Telemetry directory {input_path!r} contains no files.")
         
-        iface_num = int(grandparent.replace("cxi", "")) + 1
+        iface_num = grandparent_cxi + 1
         print(f"Collecting interface {iface_num} from {input_path}")
-        all_entries = _collect_one_interface(input_path, iface_num)
+        all_entries = _collect_one_interface(input_path, iface_num, rules, include_iso)
 
     # 2B) Multi-interface mode: parent of cxi* subdirs
-    elif os.path.isdir(input_path) and any(re.fullmatch(r"cxi\d+", d) for d in os.listdir(input_path)):
+    elif os.path.isdir(input_path) and any(_parse_cxi(d) is not None for d in os.listdir(input_path)):
         print(f"Scanning for telemetry under {input_path}")
-        found_any = False
+        tasks: List[Tuple[int, str]] = []
         for entry in sorted(os.listdir(input_path)):
-            if re.fullmatch(r"cxi\d+", entry):
+            cxi_num = _parse_cxi(entry)
+            if cxi_num is not None:
                 telemetry_dir = os.path.join(input_path, entry, "device", "telemetry")
                 if os.path.isdir(telemetry_dir):
                     # sanity check each telemetry dir
-                    files = [f for f in os.listdir(telemetry_dir)
-                             if os.path.isfile(os.path.join(telemetry_dir, f))]
-                    if not files:
+                    with os.scandir(telemetry_dir) as it:
+                        has_files = any(e.is_file() for e in it)
+                    if not has_files:
                         print(f"  Warning: {telemetry_dir!r} is empty, skipping.")
                         continue
-                    iface_num = int(entry.replace("cxi", "")) + 1
+                    iface_num = cxi_num + 1
                     print(f"Collecting interface {iface_num} from {telemetry_dir}")
-                    all_entries.extend(_collect_one_interface(telemetry_dir, iface_num))
-                    found_any = True
-        if not found_any:
+                    tasks.append((iface_num, telemetry_dir))
+        if not tasks:
             raise ValueError(f"No valid cxi*/device/telemetry subfolders found under {input_path!r}")
 
+        # Reading sysfs is I/O-bound, so interfaces overlap well on threads.
+        # map() keeps results in interface order.
+        with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as ex:
+            results = list(ex.map(lambda t: _collect_one_interface(t[1], t[0], rules, include_iso),
+                                  tasks))
+        all_entries = list(itertools.chain.from_iterable(results))
+
     else:
         # Neither telemetry nor parent-of-cxi*, bail out
         raise ValueError(
@@ -168,8 +382,7 @@ def collect(input_path: str, output_file: str):
         )
 
     # 3) Write merged JSON
-    with open(output_file, "w") as out:
-        json.dump(all_entries, out, indent=2)
+    dump_json(all_entries, output_file)
 
     print(f"Collected {len(all_entries)} counters → {output_file}")
 
@@ -183,58 +396,50 @@ def summarize(before_path: str, after_path: str, metrics_path: str = None) -> Di
     if metrics_path is None:
         metrics_path = os.path.join(os.path.dirname(__file__), 'data', 'metrics.txt')
     metrics = load_lines(metrics_path)
+    metric_names = [parse_metric_name(raw) for raw in metrics]
+    num_metrics = len(metrics)
+    num_interfaces = 8
     # Detect JSON vs txt dumps
     is_json = before_path.lower().endswith('.json') and after_path.lower().endswith('.json')
     if is_json:
-        before_list = json.load(open(before_path))
-        after_list = json.load(open(after_path))
+        before_list = load_json(before_path)
+        before_idx = index_counters(before_list)
+        after_idx = index_counters(load_json(after_path))
+        # lookup by filename match
+        before = counter_array([[lookup_counter(before_idx, iface, name) for name in metric_names]
+                                for iface in range(1, num_interfaces + 1)])
+        after = counter_array([[lookup_counter(after_idx, iface, name) for name in metric_names]
+                               for iface in range(1, num_interfaces + 1)])
     else:
-        before = load_lines(before_path)
-        after = load_lines(after_path)
-    num_metrics = len(metrics)
-    num_interfaces = 8
-    results = []
-    for m_idx, raw_metric in enumerate(metrics):
-        metric_id = m_idx + 1
-        metric_name = parse_metric_name(raw_metric)
-        for iface in range(1, num_interfaces + 1):
-            if is_json:
-                # lookup by filename match
-                key = metric_name
-                cnt_before = next((e['value'] for e in before_list
-                                   if e['counter_name'].endswith(metric_name) and e['interface']==iface), 0)
-                cnt_after = next((e['value'] for e in after_list
-                                  if e['counter_name'].endswith(metric_name) and e['interface']==iface), 0)
-            else:
-                idx = (iface - 1) * num_metrics + m_idx
-                cnt_before = parse_counter(before[idx])
-                cnt_after = parse_counter(after[idx])
-            diff = cnt_after - cnt_before
-            results.append({
-                'iface': iface,
-                'metric_id': metric_id,
-                'metric_name': metric_name,
-                'diff': diff
-            })
-    total_non_zero = sum(1 for r in results if r['diff'] != 0)
-    non_zero_per_iface = {i: sum(1 for r in results if r['iface']==i and r['diff']!=0)
-                          for i in range(1, num_interfaces+1)}
-    top20_per_iface = {}
-    for i in range(1, num_interfaces+1):
-        iface_rs = [r for r in results if r['iface']==i]
-        iface_rs.sort(key=lambda r: abs(r['diff']), reverse=True) # Takes absolute value of diff to avoid the scenario where negative differences go unaccounted for.
-        top20_per_iface[i] = iface_rs[:20]
-    important_ids = [17,18,22,839,835,869,873,
-                     564,565,613,614,
-                     1600,1599,1598,1597,
-                     1724]
+        # txt dumps hold num_metrics lines per interface, interfaces back to back
+        count = num_interfaces * num_metrics
+        before = load_counter_values(before_path, count).reshape(num_interfaces, num_metrics)
+        after = load_counter_values(after_path, count).reshape(num_interfaces, num_metrics)
+    # diffs[iface - 1, metric_id - 1]
+    diffs = counter_diff(after, before)
+    diff_rows = diffs.tolist()
+    # Important metrics, keyed in metric-id order, each with its diff on every interface.
+    # Only these ids are visited, read straight from the diff rows.
     pivot = {}
-    for r in results:
-        mid = r['metric_id']
-        if mid not in important_ids:
-            continue
-        pivot.setdefault(mid, {'metric_name': r['metric_name'], 'diffs': {}})
-        pivot[mid]['diffs'][r['iface']] = r['diff']
+    for metric_id in sorted(mid for mid in _IMPORTANT_METRIC_IDS if mid <= num_metrics):
+        pivot[metric_id] = {
+            'metric_name': metric_names[metric_id - 1],
+            'diffs': {iface: diff_rows[iface - 1][metric_id - 1]
+                      for iface in range(1, num_interfaces + 1)}
+        }
+    nz_counts = np.count_nonzero(diffs, axis=1).tolist()
+    total_non_zero = sum(nz_counts)
+    non_zero_per_iface = {i: nz_counts[i - 1] for i in range(1, num_interfaces + 1)}
+    # Rank by absolute value of diff to avoid the scenario where negative differences go unaccounted for.
+    abs_diffs = np.abs(diffs)
+    top20_per_iface = {}
+    for i in range(1, num_interfaces + 1):
+        top20_per_iface[i] = [{
+            'iface': i,
+            'metric_id': m_idx + 1,
+            'metric_name': metric_names[m_idx],
+            'diff': diff_rows[i - 1][m_idx]
+        } for m_idx in top_k_indices(abs_diffs[i - 1], 20)]
     return {
         'total_non_zero': total_non_zero,
         'non_zero_per_iface': non_zero_per_iface,
@@ -271,9 +476,14 @@ def dump(summary: Dict[str, Any]):
         print(row)
         
         
+_IFACE_BARCHARTS = (
+    iface1_barchart, iface2_barchart, iface3_barchart, iface4_barchart,
+    iface5_barchart, iface6_barchart, iface7_barchart, iface8_barchart
+)
+
+
 def dump_html(summary: dict, output_file: str):
     """Write the summary as an HTML report with charts."""
-    html = []
 
     # Prepare output path
     charts_dir = os.path.join(os.path.dirname(output_file), "charts")
@@ -284,15 +494,17 @@ def dump_html(summary: dict, output_file: str):
     else:
         print(f"Created charts directory at:      {charts_dir}")
 
-    # Generate chart images
-    iface1_barchart(summary, os.path.join(charts_dir, "iface1.png"))
-    iface2_barchart(summary, os.path.join(charts_dir, "iface2.png"))
-    iface3_barchart(summary, os.path.join(charts_dir, "iface3.png"))
-    iface4_barchart(summary, os.path.join(charts_dir, "iface4.png"))
-    iface5_barchart(summary, os.path.join(charts_dir, "iface5.png"))
-    iface6_barchart(summary, os.path.join(charts_dir, "iface6.png"))
-    iface7_barchart(summary, os.path.join(charts_dir, "iface7.png"))
-    iface8_barchart(summary, os.path.join(charts_dir, "iface8.png"))
+    # Generate chart images. The iface charts draw on their own Figure, not pyplot,
+    # so they can share a thread pool; with a single CPU a plain loop is cheaper.
+    chart_jobs = [(chart, os.path.join(charts_dir, f"iface{i}.png"))
+                  for i, chart in enumerate(_IFACE_BARCHARTS, start=1)]
+    workers = min(8, os.cpu_count() or 1)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(lambda job: job[0](summary, job[1]), chart_jobs))
+    else:
+        for chart, path in chart_jobs:
+            chart(summary, path)
 
     # one-time summary print after all images are done
     print(f"Generated 8 chart images in:       {charts_dir}")
@@ -300,90 +512,102 @@ def dump_html(summary: dict, output_file: str):
     # get a human‐readable timestamp
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    # Start HTML
-    html.append("<html><head><title>Net-Prof Summary Report — {now}</title>")
-    html.append("<style>")
-    html.append("body { font-family: sans-serif; padding: 2em; }")
-    html.append("table { border-collapse: collapse; margin: 1em 0; width: 100%; }")
-    html.append("th, td { border: 1px solid #ccc; padding: 0.5em; text-align: left; }")
-    html.append("th { background-color: #eee; }")
-    html.append("</style></head><body>")
-
-    # Title and totals
-    html.append(f"<h1>Net-Prof Summary <small>(HTML Report Created: {now})</h1>")
-    html.append(f"<h2>Total Non-zero Diffs: {summary['total_non_zero']} / 15120</h2>")
-
-    # Charts (collapsible)
-    html.append("<details open>")  # add `open` if you want it expanded by default
-    html.append("<summary><h2>Top 20 Diffs by Interface (Charts)</h2></summary>")
-    for i in range(1, 9):
-        html.append(f"<h3>Interface {i}</h3>")
-        html.append(f"<img src='charts/iface{i}.png' style='width:100%; max-width:800px;'><br><br>")
-    html.append("</details>")
-
-    # Per-interface counts
-    html.append("<h3>Non-zero Diffs by Interface</h3>")
-    html.append("<table><tr><th>Interface</th><th>Non-zero Count</th></tr>")
-    for iface, count in summary['non_zero_per_iface'].items():
-        html.append(f"<tr><td>Interface {iface}</td><td>{count} / 1890</td></tr>")
-    html.append("</table>")
-
-    # Top 20 per iface
-    # Raw tables (collapsible)
-    html.append("<details>")
-    html.append("<h3>Top 20 Diffs per Interface (Raw Table)</h3>")
-    for iface, entries in summary['top20_per_iface'].items():
-        html.append(f"<h4>Interface {iface}</h4>")
-        html.append("<table><tr><th>Rank</th><th>Metric ID</th><th>Metric Name</th><th>Diff</th></tr>")
-        for rank, entry in enumerate(entries, start=1):
-            html.append(f"<tr><td>{rank}</td><td>{entry['metric_id']}</td><td>{entry['metric_name']}</td><td>{entry['diff']}</td></tr>")
-        html.append("</table>")
-    html.append("</details>")
-
-    # Important metrics
-    html.append("<h3>Important Metrics</h3>")
-    html.append("<table><tr><th>Metric ID</th><th>Metric Name</th>" + "".join(f"<th>Iface {i}</th>" for i in range(1,9)) + "</tr>")
-    for mid, data in summary['important_metrics'].items():
-        html.append(f"<tr><td>{mid}</td><td>{data['metric_name']}</td>")
+    # Stream the report straight to disk instead of joining one big string
+    with open(output_file, 'w', buffering=1 << 20) as f:
+        w = f.write
+
+        def emit(line: str):
+            w(line)
+            w('\n')
+
+        # Start HTML
+        emit("<html><head><title>Net-Prof Summary Report — {now}</title>")
+        emit("<style>")
+        emit("body { font-family: sans-serif; padding: 2em; }")
+        emit("table { border-collapse: collapse; margin: 1em 0; width: 100%; }")
+        emit("th, td { border: 1px solid #ccc; padding: 0.5em; text-align: left; }")
+        emit("th { background-color: #eee; }")
+        emit("</style></head><body>")
+
+        # Title and totals
+        emit(f"<h1>Net-Prof Summary <small>(HTML Report Created: {now})</h1>")
+        emit(f"<h2>Total Non-zero Diffs: {summary['total_non_zero']} / 15120</h2>")
+
+        # Charts (collapsible)
+        emit("<details open>")  # add `open` if you want it expanded by default
+        emit("<summary><h2>Top 20 Diffs by Interface (Charts)</h2></summary>")
         for i in range(1, 9):
-            html.append(f"<td>{data['diffs'].get(i, 0)}</td>")
-        html.append("</tr>")
-    html.append("</table>")
-
-# --- COLLAPSIBLE GROUPS SECTION ---
-    html.append("<h2>Counter Groups Detail</h2>")
-
-    # List of (group_key, human-readable description)
-    groups = [
-        ("CxiPerfStats",           "Traffic Congestion Counter Group"),
-        ("CxiErrStats",            "Network Error Counter Group"),
-        ("CxiOpCommands",          "Operation (Command) Counter Group"),
-        ("CxiOpPackets",           "Operation (Packet) Counter Group"),
-        ("CxiDmaEngine",           "DMA Engine Counter Group"),
-        ("CxiWritesToHost",        "Writes-to-Host Counter Group"),
-        ("CxiMessageMatchingPooled","Message Matching of Pooled Counters"),
-        ("CxiTranslationUnit",     "Translation Unit Counter Group"),
-        ("CxiLatencyHist",         "Latency Histogram Counter Group"),
-        ("CxiPctReqRespTracking",  "PCT Request & Response Tracking Counter Group"),
-        ("CxiLinkReliability",     "Link Reliability Counter Group"),
-        ("CxiCongestion",          "Congestion Counter Group"),
-    ]
-
-    # assume your collect() has populated summary['collected'] as a list of dicts:
-    #   { 'id', 'interface', 'counter_name', 'value', 'timestamp', 'group', 'description' }
-    collected = summary.get("collected", [])
-
-    for key, desc in groups:
-        html.append(f"<details><summary><strong>{key}</strong> — {desc}</summary>")
-        html.append("<table><tr>"
-                    "<th>ID #</th><th>Interface #</th>"
-                    "<th>Counter Name</th><th>Value</th><th>Description</th>"
-                    "</tr>")
-
+            emit(f"<h3>Interface {i}</h3>")
+            emit(f"<img src='charts/iface{i}.png' style='width:100%; max-width:800px;'><br><br>")
+        emit("</details>")
+
+        # Per-interface counts
+        emit("<h3>Non-zero Diffs by Interface</h3>")
+        emit("<table><tr><th>Interface</th><th>Non-zero Count</th></tr>")
+        for iface, count in summary['non_zero_per_iface'].items():
+            emit(f"<tr><td>Interface {iface}</td><td>{count} / 1890</td></tr>")
+        emit("</table>")
+
+        # Top 20 per iface
+        # Raw tables (collapsible)
+        emit("<details>")
+        emit("<h3>Top 20 Diffs per Interface (Raw Table)</h3>")
+        for iface, entries in summary['top20_per_iface'].items():
+            emit(f"<h4>Interface {iface}</h4>")
+            emit("<table><tr><th>Rank</th><th>Metric ID</th><th>Metric Name</th><th>Diff</th></tr>")
+            for rank, entry in enumerate(entries, start=1):
+                emit(f"<tr><td>{rank}</td><td>{entry['metric_id']}</td><td>{entry['metric_name']}</td><td>{entry['diff']}</td></tr>")
+            emit("</table>")
+        emit("</details>")
+
+        # Important metrics
+        emit("<h3>Important Metrics</h3>")
+        emit("<table><tr><th>Metric ID</th><th>Metric Name</th>" + "".join(f"<th>Iface {i}</th>" for i in range(1,9)) + "</tr>")
+        for mid, data in summary['important_metrics'].items():
+            emit(f"<tr><td>{mid}</td><td>{data['metric_name']}</td>")
+            for i in range(1, 9):
+                emit(f"<td>{data['diffs'].get(i, 0)}</td>")
+            emit("</tr>")
+        emit("</table>")
+
+        # --- COLLAPSIBLE GROUPS SECTION ---
+        emit("<h2>Counter Groups Detail</h2>")
+
+        # List of (group_key, human-readable description)
+        groups = [
+            ("CxiPerfStats",           "Traffic Congestion Counter Group"),
+            ("CxiErrStats",            "Network Error Counter Group"),
+            ("CxiOpCommands",          "Operation (Command) Counter Group"),
+            ("CxiOpPackets",           "Operation (Packet) Counter Group"),
+            ("CxiDmaEngine",           "DMA Engine Counter Group"),
+            ("CxiWritesToHost",        "Writes-to-Host Counter Group"),
+            ("CxiMessageMatchingPooled","Message Matching of Pooled Counters"),
+            ("CxiTranslationUnit",     "Translation Unit Counter Group"),
+            ("CxiLatencyHist",         "Latency Histogram Counter Group"),
+            ("CxiPctReqRespTracking",  "PCT Request & Response Tracking Counter Group"),
+            ("CxiLinkReliability",     "Link Reliability Counter Group"),
+            ("CxiCongestion",          "Congestion Counter Group"),
+        ]
+
+        # assume your collect() has populated summary['collected'] as a list of dicts:
+        #   { 'id', 'interface', 'counter_name', 'value', 'timestamp', 'group', 'description' }
+        collected = summary.get("collected", [])
+
+        # bucket once by group, rather than rescanning collected for every group
+        by_group = defaultdict(list)
         for entry in collected:
-            if entry["group"] == key:
+            by_group[entry["group"]].append(entry)
+
+        for key, desc in groups:
+            emit(f"<details><summary><strong>{key}</strong> — {desc}</summary>")
+            emit("<table><tr>"
+                 "<th>ID #</th><th>Interface #</th>"
+                 "<th>Counter Name</th><th>Value</th><th>Description</th>"
+                 "</tr>")
+
+            for entry in by_group.get(key, ()):
                 # Tooltip on description cell via `title`
-                html.append(
+                emit(
                     "<tr>"
                     f"<td>{entry['id']}</td>"
                     f"<td>{entry['interface']}</td>"
@@ -393,14 +617,11 @@ def dump_html(summary: dict, output_file: str):
                     "</tr>"
                 )
 
-        html.append("</table></details>")
-
-    # --- end collapsible groups ---
+            emit("</table></details>")
 
-    # End HTML
-    html.append("</body></html>")
+        # --- end collapsible groups ---
 
-    with open(output_file, 'w') as f:
-        f.write('\n'.join(html))
+        # End HTML
+        w("</body></html>")
 
     print(f"HTML report saved to: {output_file}")
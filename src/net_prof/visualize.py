@@ -4,6 +4,8 @@
 
 import os
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 from typing import Dict
 
@@ -66,20 +68,25 @@ def heat_map(summary: Dict):
     
     
 def generate_iface_barchart(summary: Dict, iface: int, output_path: str):
-    """Generate a bar chart for the top 20 diffs for a given interface."""
+    """
+    Generate a bar chart for the top 20 diffs for a given interface.
+    Drawn on its own Figure/Agg canvas rather than through pyplot, so no global
+    figure state is touched and charts can be rendered from several threads.
+    """
     entries = summary['top20_per_iface'].get(iface, [])
     names = [e['metric_name'] for e in entries]
     diffs = [e['diff'] for e in entries]
 
-    plt.figure(figsize=(12, 6))
-    plt.barh(names, diffs, color='teal')
-    plt.title(f'Top 20 Diffs - Interface {iface}')
-    plt.xlabel('Difference')
-    plt.ylabel('Metric Name')
-    plt.gca().invert_yaxis()
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
+    fig = Figure(figsize=(12, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.barh(names, diffs, color='teal')
+    ax.set_title(f'Top 20 Diffs - Interface {iface}')
+    ax.set_xlabel('Difference')
+    ax.set_ylabel('Metric Name')
+    ax.invert_yaxis()
+    fig.tight_layout()
+    fig.savefig(output_path)
 
 
 def iface1_barchart(summary: Dict, output_path: str):